@@ -5,23 +5,64 @@ Save to Dinox - Save Markdown content to Dinox note-taking app
 Usage:
     python save_to_dinox.py "path/to/file.md" [--title "Title"] [--tags "tag1,tag2"]
     python save_to_dinox.py --content "markdown content" [--title "Title"] [--tags "tag1,tag2"]
+    python save_to_dinox.py --batch "path/to/notes" [--tags "tag1,tag2"] [--workers 8] [--rpm 60]
 """
 
 import argparse
+import json
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add UTF-8 encoding for Windows
-if sys.platform == "win32":
+
+def is_utf8_stream(stream):
+    """Check whether a text stream already encodes as UTF-8"""
+    return (getattr(stream, 'encoding', None) or '').replace('-', '').lower() == 'utf8'
+
+
+# Add UTF-8 encoding for Windows (consoles and UTF-8 mode already use it)
+if sys.platform == "win32" and hasattr(sys.stdout, 'reconfigure') and not is_utf8_stream(sys.stdout):
     sys.stdout.reconfigure(encoding='utf-8')
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests module not installed. Run: pip install requests")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj):
+    """Serialize obj to compact UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(data):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# KEY=value line of a .env file; comment lines never match since keys start with a letter or _
+ENV_LINE_RE = re.compile(r'^\s*([A-Za-z_]\w*)\s*=\s*(.*?)\s*$')
+
+# First markdown heading line, e.g. "## Title"; a bare "##" line captures an empty title
+# [^\S\n] is any whitespace but a newline (incl. full-width spaces), so matches stay on one line
+HEADING_RE = re.compile(r'^[^\S\n]*#+[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+
 
 def load_env_file():
     """Load environment variables from .env file"""
@@ -31,19 +72,36 @@ def load_env_file():
     if env_file.exists():
         with open(env_file, encoding='utf-8') as f:
             for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+                match = ENV_LINE_RE.match(line)
+                if match:
+                    os.environ.setdefault(*match.groups())
 
 
 load_env_file()
 
 
+class RateLimiter:
+    """Spaces out calls so at most per_minute of them start in any minute"""
+
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        """Block until the caller may start its next call"""
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 class DinoxClient:
     """Dinox API client for saving notes"""
 
-    def __init__(self, token=None):
+    def __init__(self, token=None, pool_maxsize=8):
         self.token = token or os.environ.get("DINOX_TOKEN")
         if not self.token:
             raise ValueError("DINOX_TOKEN not found. Set it in .env or pass --token")
@@ -53,6 +111,32 @@ class DinoxClient:
             "Content-Type": "application/json"
         }
 
+        # Reuse one session so the fallback call (and repeated saves) keep the TLS connection alive
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Retry transient failures with exponential backoff; read errors are not retried since the
+        # note may already have been created, and the last response is returned instead of raising
+        retry = Retry(
+            total=4,
+            read=False,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=retry))
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def save_markdown(self, content, title=None, tags=None):
         """
         Save markdown content to Dinox
@@ -68,27 +152,27 @@ class DinoxClient:
         # Prepare content with title if provided
         if title:
             # Add title as H1 at the beginning
-            full_content = f"# {title}\n\n{content}"
+            full_content = "".join(("# ", title, "\n\n", content))
         else:
             full_content = content
 
         # Add tags at the end if provided
         if tags:
-            tag_line = " ".join([f"#{tag}" for tag in tags])
+            tag_line = " ".join(f"#{tag}" for tag in tags)
             full_content = f"{full_content}\n\n{tag_line}"
 
         # First try: Use markdown import endpoint
         markdown_import_url = f"{self.base_url}/markdown/import/{self.token}"
 
-        response = requests.post(
+        response = self.session.post(
             markdown_import_url,
             headers=self.headers,
-            json={"content": full_content},
+            data=dumps_json({"content": full_content}),
             timeout=30
         )
 
         if response.ok:
-            result = response.json()
+            result = loads_json(response.content)
             if result.get("code") == "000000":
                 return {
                     "success": True,
@@ -110,10 +194,10 @@ class DinoxClient:
             "tags": tags or []
         }
 
-        response = requests.post(
+        response = self.session.post(
             create_note_url,
             headers=headers,
-            json=payload,
+            data=dumps_json(payload),
             timeout=30
         )
 
@@ -122,7 +206,7 @@ class DinoxClient:
         return {
             "success": True,
             "method": "create_note",
-            "response": response.json()
+            "response": loads_json(response.content)
         }
 
     def save_file(self, file_path, title=None, tags=None):
@@ -137,15 +221,76 @@ class DinoxClient:
 
         # Use title from file if not provided
         if not title:
-            # Try to get first heading
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('#'):
-                    title = line.lstrip('#').strip()
-                    break
+            # Try to get first heading; the search stops at the first match
+            match = HEADING_RE.search(content)
+            if match and match.group(1):
+                title = match.group(1)
 
         return self.save_markdown(content, title=title, tags=tags)
 
+    def save_files(self, file_paths, tags=None, max_workers=8, per_minute=None):
+        """
+        Save several markdown files concurrently over the shared session
+
+        Args:
+            file_paths: Paths of markdown files
+            tags: Optional list of tags applied to every note
+            max_workers: Maximum number of requests in flight (keep within the client's pool_maxsize)
+            per_minute: Optional cap on notes started per minute
+
+        Returns:
+            list: (file_path, result, error) tuples in input order
+        """
+        limiter = RateLimiter(per_minute) if per_minute else None
+
+        def save_one(file_path):
+            if limiter:
+                limiter.wait()
+            try:
+                return file_path, self.save_file(file_path, tags=tags), None
+            except Exception as e:
+                return file_path, None, e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(save_one, file_paths))
+
+
+def run_batch(directory, token, tags, workers, per_minute=None):
+    """Save all markdown files under directory and print a summary"""
+    directory = Path(directory)
+    if not directory.is_dir():
+        print(f"\n❌ Error: Directory not found: {directory}", file=sys.stderr)
+        sys.exit(1)
+
+    file_paths = sorted(directory.rglob("*.md"))
+    if not file_paths:
+        print(f"No markdown files found in {directory}")
+        return
+
+    try:
+        # One pooled connection per worker, so none are discarded under load
+        with DinoxClient(token=token, pool_maxsize=workers) as client:
+            results = client.save_files(file_paths, tags=tags, max_workers=workers, per_minute=per_minute)
+    except Exception as e:
+        print(f"\n❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    failed = 0
+    print("\n" + "="*50)
+    for file_path, result, error in results:
+        if error:
+            failed += 1
+            print(f"❌ {file_path}: {error}")
+        else:
+            note_id = result.get("noteId")
+            print(f"✅ {file_path}" + (f" (Note ID: {note_id})" if note_id else ""))
+    print("="*50)
+    print(f"Saved {len(results) - failed}/{len(results)} files to Dinox")
+    print("="*50)
+
+    if failed:
+        sys.exit(1)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -165,6 +310,9 @@ Examples:
   # Save raw content
   %(prog)s --content "# Hello\\n\\nWorld"
 
+  # Save every markdown file in a directory
+  %(prog)s --batch "notes/" --tags "AI"
+
 Environment Variables:
   DINOX_TOKEN    Your Dinox API token
         """
@@ -191,6 +339,26 @@ Environment Variables:
         help="Comma-separated tags (e.g., 'AI,技术,笔记')"
     )
 
+    parser.add_argument(
+        "--batch",
+        metavar="DIR",
+        help="Save every .md file under DIR (recursively)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Concurrent requests in --batch mode (default: 8)"
+    )
+
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=None,
+        help="Maximum notes saved per minute in --batch mode (default: no limit)"
+    )
+
     parser.add_argument(
         "--token",
         help="Dinox API token (or set DINOX_TOKEN env var)"
@@ -199,24 +367,37 @@ Environment Variables:
     args = parser.parse_args()
 
     # Validate input
-    if not args.file and not args.content:
-        parser.error("Either FILE or --content must be provided")
+    sources = [source for source in (args.file, args.content, args.batch) if source]
+    if not sources:
+        parser.error("Either FILE, --content or --batch must be provided")
+
+    if len(sources) > 1:
+        parser.error("Use only one of FILE, --content and --batch")
+
+    if args.batch and args.title:
+        parser.error("--title cannot be used with --batch")
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
 
-    if args.file and args.content:
-        parser.error("Cannot use both FILE and --content")
+    if args.rpm is not None and args.rpm < 1:
+        parser.error("--rpm must be at least 1")
 
     # Parse tags
     tags = None
     if args.tags:
-        tags = [tag.strip() for tag in args.tags.split(',')]
+        tags = list(map(str.strip, args.tags.split(',')))
 
-    try:
-        client = DinoxClient(token=args.token)
+    if args.batch:
+        run_batch(args.batch, args.token, tags, args.workers, per_minute=args.rpm)
+        return
 
-        if args.content:
-            result = client.save_markdown(args.content, title=args.title, tags=tags)
-        else:
-            result = client.save_file(args.file, title=args.title, tags=tags)
+    try:
+        with DinoxClient(token=args.token) as client:
+            if args.content:
+                result = client.save_markdown(args.content, title=args.title, tags=tags)
+            else:
+                result = client.save_file(args.file, title=args.title, tags=tags)
 
         print("\n" + "="*50)
         print("✅ Saved to Dinox!")
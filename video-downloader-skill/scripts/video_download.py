@@ -7,28 +7,93 @@ Improved version with better error handling and debugging.
 """
 
 import argparse
+import codecs
+import io
 import sys
 import subprocess
 import json
 import os
-import re
+import shutil
+import tempfile
+import threading
 import time
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse, parse_qs
 
+# Seconds between background stdout flushes while streaming yt-dlp output
+OUTPUT_FLUSH_INTERVAL = 0.2
+
+# Maximum bytes read from the yt-dlp pipe at once
+OUTPUT_CHUNK_SIZE = 1 << 16
+
+# Cached result of `yt-dlp --version`, reused while fresh and newer than the executable
+YTDLP_CACHE_FILE = Path.home() / ".cache" / "tabor-skills" / "yt-dlp.ok"
+YTDLP_CACHE_MAX_AGE = 24 * 60 * 60
+
+
+def is_utf8_stream(stream):
+    """Check whether a text stream already encodes as UTF-8."""
+    return (getattr(stream, 'encoding', None) or '').replace('-', '').lower() == 'utf8'
+
+
 # Set UTF-8 encoding for Windows console
+# Consoles (and UTF-8 mode) already use UTF-8; only ANSI code page pipes need switching
 if sys.platform == "win32":
     # Ensure stdout/stderr use UTF-8 where possible without detaching
     try:
-        if hasattr(sys.stdout, 'reconfigure'):
+        if hasattr(sys.stdout, 'reconfigure') and not is_utf8_stream(sys.stdout):
             sys.stdout.reconfigure(encoding='utf-8', errors='replace')
-        if hasattr(sys.stderr, 'reconfigure'):
+        if hasattr(sys.stderr, 'reconfigure') and not is_utf8_stream(sys.stderr):
             sys.stderr.reconfigure(encoding='utf-8', errors='replace')
     except Exception:
         # If reconfigure fails, try alternative approach
-        import io
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+        if not is_utf8_stream(sys.stdout):
+            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        if not is_utf8_stream(sys.stderr):
+            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+
+class TextStreamWriter:
+    """Bytes-to-text adapter for a sys.stdout that has no binary buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        # Incremental so a UTF-8 character split across chunks still decodes
+        self.decoder = codecs.getincrementaldecoder('utf-8')('replace')
+
+    def write(self, data):
+        self.stream.write(self.decoder.decode(data))
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        self.stream.write(self.decoder.decode(b'', final=True))
+        self.stream.flush()
+
+
+def open_stream_writer():
+    """
+    Open a 64KB-buffered binary writer over stdout for streaming yt-dlp output.
+    Unlike sys.stdout it does not flush on every newline; the caller flushes.
+    Falls back to decoding into sys.stdout when it has no binary buffer.
+    """
+    sys.stdout.flush()
+    if not hasattr(sys.stdout, 'buffer'):
+        return TextStreamWriter(sys.stdout)
+    return io.BufferedWriter(sys.stdout.buffer, buffer_size=1 << 16)
+
+
+def close_stream_writer(writer):
+    """Flush a writer from open_stream_writer without closing stdout."""
+    if isinstance(writer, TextStreamWriter):
+        writer.close()
+        return
+    writer.flush()
+    writer.detach()
+    sys.stdout.buffer.flush()
 
 
 def safe_print(text):
@@ -46,14 +111,18 @@ def safe_print(text):
             sys.stdout.flush()
 
 
+# The same URL is parsed several times per download
+cached_urlparse = lru_cache(maxsize=32)(urlparse)
+
+
+@lru_cache(maxsize=64)
 def is_bilibili_url(url):
     """Check if the URL is from Bilibili."""
     if not url:
         return False
     try:
-        parsed_url = urlparse(url)
-        bilibili_pattern = r'(.*\.)?bilibili\.com$'
-        return bool(re.search(bilibili_pattern, parsed_url.netloc))
+        netloc = cached_urlparse(url).netloc.lower()
+        return netloc == 'bilibili.com' or netloc.endswith('.bilibili.com')
     except Exception:
         return False
 
@@ -66,7 +135,7 @@ def format_bilibili_url(url):
         return url
 
     try:
-        parsed = urlparse(url)
+        parsed = cached_urlparse(url)
         query_params = parse_qs(parsed.query)
 
         # Construct base URL (without query params)
@@ -83,19 +152,56 @@ def format_bilibili_url(url):
         return url
 
 
-def check_yt_dlp():
+def get_cached_yt_dlp_version():
+    """Return the cached yt-dlp version, or None if the cache is missing or stale."""
+    exe = shutil.which("yt-dlp")
+    if not exe:
+        return None
+    try:
+        cache_mtime = YTDLP_CACHE_FILE.stat().st_mtime
+        if cache_mtime <= os.stat(exe).st_mtime or time.time() - cache_mtime > YTDLP_CACHE_MAX_AGE:
+            return None
+        return YTDLP_CACHE_FILE.read_text(encoding='utf-8').strip() or None
+    except OSError:
+        return None
+
+
+def save_cached_yt_dlp_version(version):
+    """Record a working yt-dlp version; failures to write the cache are ignored."""
+    try:
+        YTDLP_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        YTDLP_CACHE_FILE.write_text(version, encoding='utf-8')
+    except OSError:
+        pass
+
+
+def get_yt_dlp_version():
+    """Return the installed yt-dlp version, using the cache when possible."""
+    version = get_cached_yt_dlp_version()
+    if version:
+        return version
+
+    try:
+        result = subprocess.run(["yt-dlp", "--version"], capture_output=True, check=True, text=True)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    version = result.stdout.strip()
+    save_cached_yt_dlp_version(version)
+    return version
+
+
+def check_yt_dlp(verbose=False):
     """Check if yt-dlp is installed, install if not."""
     # Add user's local bin to PATH
     local_bin = str(Path.home() / ".local" / "bin")
     if local_bin not in os.environ.get("PATH", ""):
         os.environ["PATH"] = f"{local_bin}:{os.environ.get('PATH', '')}"
 
-    try:
-        result = subprocess.run(["yt-dlp", "--version"], capture_output=True, check=True, text=True)
-        safe_print(f"yt-dlp version: {result.stdout.strip()}")
+    # A PATH lookup is enough to know yt-dlp is there; only spawn it to report the version
+    if shutil.which("yt-dlp"):
+        if verbose:
+            safe_print(f"yt-dlp version: {get_yt_dlp_version() or 'unknown'}")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        pass
 
     safe_print("yt-dlp not found. Installing...")
     try:
@@ -143,8 +249,26 @@ def get_video_info(url):
         return None
 
 
+def print_video_info(info):
+    """Print title, duration and uploader from yt-dlp's JSON info."""
+    safe_print(f"Title: {info.get('title', 'Unknown')}")
+    duration = info.get('duration', 0)
+    if duration:
+        try:
+            duration_val = float(duration)
+            minutes = int(duration_val // 60)
+            seconds = int(duration_val % 60)
+            safe_print(f"Duration: {minutes}:{seconds:02d}")
+        except (ValueError, TypeError):
+            safe_print(f"Duration: {duration}")
+    safe_print(f"Uploader: {info.get('uploader', 'Unknown')}")
+
+
 def test_url_access(url):
-    """Test if the URL is accessible."""
+    """
+    Test if the URL is accessible.
+    Returns (accessible, error_message); nothing is printed so it can run on a worker thread.
+    """
     try:
         import urllib.request
         import urllib.error
@@ -153,21 +277,116 @@ def test_url_access(url):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
 
+        # HEAD sends no body; only fall back to GET for servers that reject it
+        req = urllib.request.Request(url, headers=headers, method='HEAD')
+        try:
+            with urllib.request.urlopen(req, timeout=5) as response:
+                return (True, None)
+        except urllib.error.HTTPError as e:
+            if e.code != 405:
+                raise
+
         req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            return response.getcode() == 200
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return (True, None)
     except Exception as e:
-        safe_print(f"URL access test failed: {e}")
-        return False
+        return (False, str(e))
+
+
+def start_url_access_test(url):
+    """
+    Run test_url_access on a daemon thread and return a Future for its result.
+    The daemon thread never holds up interpreter exit once the download is done.
+    """
+    future = Future()
+
+    def run():
+        future.set_result(test_url_access(url))
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
-def download_video_internal(url, output_path, quality, format_type, audio_only, is_retry=False):
+def resolve_output_path(output_path):
     """
-    Internal function to download video with specific URL.
+    Resolve and create the output directory.
+    Returns the absolute path, or None if it could not be created.
+    """
+    # Smart default output path detection
+    if output_path is None:
+        cwd = os.getcwd()
+
+        # Try to detect if we are inside a .claude directory structure (nearest one wins)
+        claude_base = None
+        parts = cwd.split(os.sep)
+        if ".claude" in parts:
+            idx = len(parts) - 1 - parts[::-1].index(".claude")
+            # Trailing separator keeps roots like "/" and "C:\\" intact
+            claude_base = Path(os.sep.join(parts[:idx] + [""]))
+
+        if claude_base:
+            # If we found a .claude directory, we use its parent as the base
+            # Prefer 'Downloads' folder if it exists in the base directory
+            downloads_dir = claude_base / "Downloads"
+            if downloads_dir.exists() and downloads_dir.is_dir():
+                output_path = str(downloads_dir)
+            else:
+                output_path = str(claude_base)
+        else:
+            # If no .claude found, use the current working directory
+            output_path = cwd
+
+    # Ensure output directory exists and use absolute path
+    try:
+        output_path = os.path.abspath(output_path)
+        os.makedirs(output_path, exist_ok=True)
+        safe_print(f"Output directory: {output_path}")
+    except Exception as e:
+        safe_print(f"[ERROR] Failed to create output directory: {e}")
+        return None
+
+    return output_path
+
+
+def list_downloaded_files(output_path):
+    """List files in output directory to show what was downloaded."""
+    try:
+        with os.scandir(output_path) as it:
+            files = [f for f in it if f.is_file()]
+        video_files = [f for f in files if f.name.lower().endswith(('.mp4', '.mp3', '.webm', '.mkv'))]
+        if video_files:
+            print()
+            safe_print("Downloaded files:")
+            safe_print("-" * 50)
+            for f in video_files:
+                size_bytes = f.stat().st_size
+                if size_bytes > 1024 * 1024:  # > 1MB
+                    size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
+                elif size_bytes > 1024:  # > 1KB
+                    size_str = f"{size_bytes / 1024:.1f} KB"
+                else:
+                    size_str = f"{size_bytes} bytes"
+                safe_print(f"  ✓ {f.name}")
+                safe_print(f"    Size: {size_str}")
+                safe_print(f"    Location: {os.path.abspath(f.path)}")
+                print()
+        else:
+            safe_print("No video files found in output directory.")
+            safe_print("Files in directory:")
+            for f in files:
+                safe_print(f"  - {f.name}")
+    except Exception as e:
+        safe_print(f"Could not list downloaded files: {e}")
+
+
+def download_video_internal(urls, output_path, quality, format_type, audio_only, is_retry=False, debug=False):
+    """
+    Internal function to download videos with specific URLs in a single yt-dlp run.
+    All URLs are expected to be from the same platform.
     Returns (success, error_message)
     """
     # Check platform type
-    is_bilibili = is_bilibili_url(url)
+    is_bilibili = is_bilibili_url(urls[0])
 
     # Build command
     cmd = ["yt-dlp"]
@@ -219,37 +438,46 @@ def download_video_internal(url, output_path, quality, format_type, audio_only,
     cmd.extend([
         "-o", output_template,
         "--no-playlist",  # Don't download playlists by default
-        "--verbose",  # Add verbose output for better debugging
+        "--newline",  # One progress update per line instead of \r redraws
     ])
 
-    cmd.append(url)
+    if debug:
+        cmd.append("--verbose")  # Full yt-dlp debug output
+
+    # Print video info from the download run itself instead of a separate --dump-json call
+    if not is_retry:
+        cmd.extend([
+            "--print", "before_dl:Title: %(title)s",
+            "--print", "before_dl:Duration: %(duration_string)s",
+            "--print", "before_dl:Uploader: %(uploader)s",
+            "--progress",  # --print implies --quiet, keep the progress bar
+        ])
+
+    # Several URLs go through yt-dlp's batch file option, keeping the command line short
+    # (Windows limits it to about 32K characters)
+    batch_path = None
+    if len(urls) > 1:
+        try:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as f:
+                f.write("\n".join(urls) + "\n")
+            batch_path = f.name
+        except OSError as e:
+            return (False, f"Could not write URL batch file: {e}")
+        cmd.extend(["--batch-file", batch_path])
+    else:
+        cmd.extend(urls)
 
     if not is_retry:
-        safe_print(f"Downloading from: {url}")
+        if batch_path:
+            safe_print(f"Downloading {len(urls)} URLs via batch file")
+        else:
+            safe_print(f"Downloading from: {urls[0]}")
         if is_bilibili:
             safe_print(f"Platform: Bilibili (with anti-412 protection)")
         safe_print(f"Quality: {quality}")
         safe_print(f"Format: {'mp3 (audio only)' if audio_only else format_type}")
         safe_print(f"Output: {output_path}\n")
 
-        # Get video info first
-        info = get_video_info(url)
-        if info:
-            safe_print(f"Title: {info.get('title', 'Unknown')}")
-            duration = info.get('duration', 0)
-            if duration:
-                try:
-                    duration_val = float(duration)
-                    minutes = int(duration_val // 60)
-                    seconds = int(duration_val % 60)
-                    safe_print(f"Duration: {minutes}:{seconds:02d}")
-                except (ValueError, TypeError):
-                    safe_print(f"Duration: {duration}")
-            safe_print(f"Uploader: {info.get('uploader', 'Unknown')}\n")
-        else:
-            safe_print("Warning: Could not fetch video info")
-            safe_print("Attempting to download anyway...\n")
-
         safe_print("Starting download...")
         safe_print(f"Command: {' '.join(cmd)}")
 
@@ -260,32 +488,46 @@ def download_video_internal(url, output_path, quality, format_type, audio_only,
 
     # Use Popen for real-time output instead of capture_output
     try:
+        # Read raw bytes and pass them through as-is; yt-dlp is told to emit UTF-8
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,  # Combine stderr with stdout
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            bufsize=1,  # Line buffered
-            universal_newlines=True
+            env={**os.environ, "PYTHONIOENCODING": "utf-8"}
         )
 
-        # Read output line by line for real-time display
-        while True:
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                # Clean up the output for better display
-                cleaned_output = output.strip()
-                if cleaned_output:  # Only print non-empty lines
-                    # Skip verbose debug lines that are too long
-                    if len(cleaned_output) < 200:
-                        safe_print(cleaned_output)
-                    else:
-                        # Show abbreviated version of long lines
-                        safe_print(cleaned_output[:100] + "..." + cleaned_output[-50:])
+        # Pass output through in chunks for real-time display. The read loop never flushes;
+        # a flusher thread does every OUTPUT_FLUSH_INTERVAL, so output written before a quiet
+        # period (e.g. an ffmpeg merge) still shows up promptly
+        out = open_stream_writer()
+        out_lock = threading.Lock()
+        stop_flushing = threading.Event()
+
+        def flush_periodically():
+            while not stop_flushing.wait(OUTPUT_FLUSH_INTERVAL):
+                with out_lock:
+                    out.flush()
+
+        flusher = threading.Thread(target=flush_periodically, daemon=True)
+        flusher.start()
+        ends_with_newline = True
+        try:
+            # read1() returns b'' at EOF, i.e. once yt-dlp closes its output
+            with process.stdout:
+                while True:
+                    output = process.stdout.read1(OUTPUT_CHUNK_SIZE)
+                    if not output:
+                        break
+                    with out_lock:
+                        out.write(output)
+                    ends_with_newline = output.endswith(b"\n")
+        finally:
+            stop_flushing.set()
+            flusher.join()
+            # Keep the closing rule on its own line
+            if not ends_with_newline:
+                out.write(b"\n")
+            close_stream_writer(out)
 
         # Wait for process to complete and get return code
         return_code = process.wait(timeout=300)
@@ -306,10 +548,48 @@ def download_video_internal(url, output_path, quality, format_type, audio_only,
             process.kill()
         safe_print(f"[ERROR] Unexpected error during download: {str(e)}")
         return (False, f"Unexpected error during download: {str(e)}")
+    finally:
+        if batch_path:
+            try:
+                os.remove(batch_path)
+            except OSError:
+                pass
 
 
+def print_troubleshooting_tips(error_msg, is_bilibili):
+    """Provide helpful hints for common errors."""
+    print()
+    safe_print("[TROUBLESHOOTING TIPS]")
+    if is_bilibili:
+        safe_print("For Bilibili videos:")
+        if error_msg and "412" in error_msg:
+            safe_print("  • 412 error: Content not available in your region or requires login")
+            safe_print("  • Try using cookies from your browser (use -c option)")
+            safe_print("  • Wait a few minutes before retrying")
+        elif error_msg and ("403" in error_msg or "forbidden" in error_msg.lower()):
+            safe_print("  • 403 error: Access forbidden - Video might be restricted")
+            safe_print("  • Try using cookies or a different quality setting")
+        elif error_msg and ("404" in error_msg or "not found" in error_msg.lower()):
+            safe_print("  • 404 error: Video not found - Check if the URL is correct")
+        elif error_msg and "login" in error_msg.lower():
+            safe_print("  • Login required - Use cookies from your browser (use -c option)")
+        else:
+            safe_print("  • Try using cookies from your browser (use -c option)")
+            safe_print("  • Try a different quality setting (e.g., 720p instead of 1080p)")
+            safe_print("  • Check your internet connection")
+    else:
+        safe_print("General troubleshooting:")
+        safe_print("  • Check if the URL is correct and the video is still available")
+        safe_print("  • Try a different quality setting")
+        safe_print("  • Check your internet connection")
+        safe_print("  • For private/restricted videos, try using cookies (use -c option)")
+
+    print()
+    safe_print("For more help, visit: https://github.com/yt-dlp/yt-dlp/wiki")
 
-def download_video(url, output_path=None, quality="best", format_type="mp4", audio_only=False):
+
+def download_video(url, output_path=None, quality="best", format_type="mp4", audio_only=False, dry_run=False,
+                   verbose=False, debug=False):
     """
     Download a video from YouTube, Bilibili or other platforms.
 
@@ -319,58 +599,18 @@ def download_video(url, output_path=None, quality="best", format_type="mp4", aud
         quality: Quality setting (best, 1080p, 720p, 480p, 360p, worst)
         format_type: Output format (mp4, webm, mkv, etc.)
         audio_only: Download only audio (mp3)
+        dry_run: Only show video info without downloading
+        verbose: Show extra details such as the yt-dlp version
+        debug: Pass --verbose to yt-dlp
     """
     safe_print("=== Video Downloader Started ===")
 
     # First check if yt-dlp is available
-    if not check_yt_dlp():
+    if not check_yt_dlp(verbose=verbose):
         safe_print("[ERROR] Failed to install or find yt-dlp. Please install it manually:")
         safe_print("pip install yt-dlp")
         return False
 
-    # Test URL accessibility
-    safe_print(f"Testing URL accessibility: {url}")
-    if not test_url_access(url):
-        safe_print("[WARNING] URL might not be accessible. This could be due to:")
-        safe_print("  - Network connectivity issues")
-        safe_print("  - Video requires login/authentication")
-        safe_print("  - Video is region-restricted")
-        safe_print("  - Video has been removed or made private")
-        safe_print("Continuing with download attempt anyway...")
-        print()
-
-    # Smart default output path detection
-    if output_path is None:
-        cwd = Path.cwd()
-
-        # Try to detect if we are inside a .claude directory structure
-        claude_base = None
-        for parent in [cwd] + list(cwd.parents):
-            if parent.name == ".claude":
-                claude_base = parent.parent
-                break
-
-        if claude_base:
-            # If we found a .claude directory, we use its parent as the base
-            # Prefer 'Downloads' folder if it exists in the base directory
-            downloads_dir = claude_base / "Downloads"
-            if downloads_dir.exists() and downloads_dir.is_dir():
-                output_path = str(downloads_dir)
-            else:
-                output_path = str(claude_base)
-        else:
-            # If no .claude found, use the current working directory
-            output_path = str(cwd)
-
-    # Ensure output directory exists and use absolute path
-    try:
-        output_path = os.path.abspath(output_path)
-        os.makedirs(output_path, exist_ok=True)
-        safe_print(f"Output directory: {output_path}")
-    except Exception as e:
-        safe_print(f"[ERROR] Failed to create output directory: {e}")
-        return False
-
     is_bilibili = is_bilibili_url(url)
 
     if is_bilibili:
@@ -379,44 +619,33 @@ def download_video(url, output_path=None, quality="best", format_type="mp4", aud
         if original_url != url:
             safe_print(f"Cleaned Bilibili URL: {url}")
 
+    # Dry run only reads info, so it neither probes the URL nor creates the output directory
+    if dry_run:
+        info = get_video_info(url)
+        if not info:
+            safe_print("[ERROR] Could not fetch video info")
+            return False
+        print_video_info(info)
+        return True
+
+    # Test URL accessibility in the background; the result is only needed if the download fails
+    url_access = start_url_access_test(url)
+
+    output_path = resolve_output_path(output_path)
+    if output_path is None:
+        return False
+
     try:
         # Attempt download
         success, error_msg = download_video_internal(
-            url, output_path, quality, format_type, audio_only, is_retry=False
+            [url], output_path, quality, format_type, audio_only, is_retry=False, debug=debug
         )
 
         if success:
             safe_print("\n[SUCCESS] Download complete!")
             safe_print(f"Saved to: {output_path}")
 
-            # List files in output directory to show what was downloaded
-            try:
-                files = list(Path(output_path).glob("*"))
-                video_files = [f for f in files if f.is_file() and f.suffix.lower() in ['.mp4', '.mp3', '.webm', '.mkv']]
-                if video_files:
-                    print()
-                    safe_print("Downloaded files:")
-                    safe_print("-" * 50)
-                    for f in video_files:
-                        size_bytes = f.stat().st_size
-                        if size_bytes > 1024 * 1024:  # > 1MB
-                            size_str = f"{size_bytes / (1024 * 1024):.1f} MB"
-                        elif size_bytes > 1024:  # > 1KB
-                            size_str = f"{size_bytes / 1024:.1f} KB"
-                        else:
-                            size_str = f"{size_bytes} bytes"
-                        safe_print(f"  ✓ {f.name}")
-                        safe_print(f"    Size: {size_str}")
-                        safe_print(f"    Location: {f.absolute()}")
-                        print()
-                else:
-                    safe_print("No video files found in output directory.")
-                    safe_print("Files in directory:")
-                    for f in files:
-                        if f.is_file():
-                            safe_print(f"  - {f.name}")
-            except Exception as e:
-                safe_print(f"Could not list downloaded files: {e}")
+            list_downloaded_files(output_path)
 
             return True
 
@@ -426,7 +655,7 @@ def download_video(url, output_path=None, quality="best", format_type="mp4", aud
             time.sleep(2)  # Brief pause before retry
 
             success, retry_error_msg = download_video_internal(
-                url, output_path, quality, format_type, audio_only, is_retry=True
+                [url], output_path, quality, format_type, audio_only, is_retry=True, debug=debug
             )
 
             if success:
@@ -445,35 +674,17 @@ def download_video(url, output_path=None, quality="best", format_type="mp4", aud
             clean_retry_error = retry_error_msg.replace('\n', '\n  ')
             safe_print(f"  Retry error: {clean_retry_error}")
 
-        # Provide helpful hints for common errors
-        print()
-        safe_print("[TROUBLESHOOTING TIPS]")
-        if is_bilibili:
-            safe_print("For Bilibili videos:")
-            if error_msg and "412" in error_msg:
-                safe_print("  • 412 error: Content not available in your region or requires login")
-                safe_print("  • Try using cookies from your browser (use -c option)")
-                safe_print("  • Wait a few minutes before retrying")
-            elif error_msg and ("403" in error_msg or "forbidden" in error_msg.lower()):
-                safe_print("  • 403 error: Access forbidden - Video might be restricted")
-                safe_print("  • Try using cookies or a different quality setting")
-            elif error_msg and ("404" in error_msg or "not found" in error_msg.lower()):
-                safe_print("  • 404 error: Video not found - Check if the URL is correct")
-            elif error_msg and "login" in error_msg.lower():
-                safe_print("  • Login required - Use cookies from your browser (use -c option)")
-            else:
-                safe_print("  • Try using cookies from your browser (use -c option)")
-                safe_print("  • Try a different quality setting (e.g., 720p instead of 1080p)")
-                safe_print("  • Check your internet connection")
-        else:
-            safe_print("General troubleshooting:")
-            safe_print("  • Check if the URL is correct and the video is still available")
-            safe_print("  • Try a different quality setting")
-            safe_print("  • Check your internet connection")
-            safe_print("  • For private/restricted videos, try using cookies (use -c option)")
+        accessible, access_error = url_access.result()
+        if not accessible:
+            print()
+            safe_print(f"[WARNING] URL access test failed: {access_error}")
+            safe_print("The URL might not be accessible. This could be due to:")
+            safe_print("  - Network connectivity issues")
+            safe_print("  - Video requires login/authentication")
+            safe_print("  - Video is region-restricted")
+            safe_print("  - Video has been removed or made private")
 
-        print()
-        safe_print("For more help, visit: https://github.com/yt-dlp/yt-dlp/wiki")
+        print_troubleshooting_tips(error_msg, is_bilibili)
 
         return False
 
@@ -482,11 +693,86 @@ def download_video(url, output_path=None, quality="best", format_type="mp4", aud
         return False
 
 
+def download_videos(urls, output_path=None, quality="best", format_type="mp4", audio_only=False,
+                    verbose=False, debug=False):
+    """
+    Download several videos with one yt-dlp run per platform instead of one per URL.
+
+    Args:
+        urls: Video URLs
+        output_path: Directory to save the videos (default: smart detection)
+        quality: Quality setting (best, 1080p, 720p, 480p, 360p, worst)
+        format_type: Output format (mp4, webm, mkv, etc.)
+        audio_only: Download only audio (mp3)
+        verbose: Show extra details such as the yt-dlp version
+        debug: Pass --verbose to yt-dlp
+    """
+    safe_print("=== Video Downloader Started ===")
+    safe_print(f"Batch mode: {len(urls)} URLs")
+
+    if not check_yt_dlp(verbose=verbose):
+        safe_print("[ERROR] Failed to install or find yt-dlp. Please install it manually:")
+        safe_print("pip install yt-dlp")
+        return False
+
+    output_path = resolve_output_path(output_path)
+    if output_path is None:
+        return False
+
+    # Bilibili needs its own headers and extractor args, so it gets a separate run
+    bilibili_urls = [format_bilibili_url(url) for url in urls if is_bilibili_url(url)]
+    other_urls = [url for url in urls if not is_bilibili_url(url)]
+
+    failures = []
+    for group, is_bilibili in ((bilibili_urls, True), (other_urls, False)):
+        if not group:
+            continue
+        success, error_msg = download_video_internal(
+            group, output_path, quality, format_type, audio_only, is_retry=False, debug=debug
+        )
+
+        # Same Bilibili retry as single downloads; yt-dlp skips files already downloaded
+        if not success and is_bilibili and "412" not in (error_msg or ""):
+            safe_print("\n[RETRY] Attempting Bilibili downloads with alternative settings...")
+            time.sleep(2)  # Brief pause before retry
+            success, error_msg = download_video_internal(
+                group, output_path, quality, format_type, audio_only, is_retry=True, debug=debug
+            )
+
+        if not success:
+            failures.append((error_msg, is_bilibili))
+
+    if failures:
+        print()
+        safe_print("[ERROR] Some downloads failed (see yt-dlp output above):")
+        for error_msg, is_bilibili in failures:
+            safe_print(f"  {error_msg}")
+        for error_msg, is_bilibili in failures:
+            print_troubleshooting_tips(error_msg, is_bilibili)
+        return False
+
+    safe_print("\n[SUCCESS] All downloads complete!")
+    safe_print(f"Saved to: {output_path}")
+    list_downloaded_files(output_path)
+    return True
+
+
+def read_batch_file(path):
+    """Read URLs from a file, one per line; blank lines and # comments are skipped."""
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Download videos from YouTube, Bilibili and other platforms with customizable quality and format"
     )
-    parser.add_argument("url", help="Video URL")
+    parser.add_argument("url", nargs="*", help="Video URL(s); several URLs share one yt-dlp run")
+    parser.add_argument(
+        "-b", "--batch-file",
+        default=None,
+        help="File with one URL per line to download in one yt-dlp run"
+    )
     parser.add_argument(
         "-o", "--output",
         default=None,
@@ -509,15 +795,56 @@ def main():
         action="store_true",
         help="Download only audio as MP3"
     )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show video info without downloading"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Show extra details such as the yt-dlp version"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Show yt-dlp's full debug output"
+    )
 
     args = parser.parse_args()
 
+    urls = list(args.url)
+    if args.batch_file:
+        try:
+            urls.extend(read_batch_file(args.batch_file))
+        except OSError as e:
+            parser.error(f"cannot read batch file: {e}")
+    if not urls:
+        parser.error("at least one URL or --batch-file is required")
+
+    if len(urls) > 1:
+        if args.dry_run:
+            parser.error("--dry-run supports a single URL only")
+        success = download_videos(
+            urls=urls,
+            output_path=args.output,
+            quality=args.quality,
+            format_type=args.format,
+            audio_only=args.audio_only,
+            verbose=args.verbose,
+            debug=args.debug
+        )
+        sys.exit(0 if success else 1)
+
     success = download_video(
-        url=args.url,
+        url=urls[0],
         output_path=args.output,
         quality=args.quality,
         format_type=args.format,
-        audio_only=args.audio_only
+        audio_only=args.audio_only,
+        dry_run=args.dry_run,
+        verbose=args.verbose,
+        debug=args.debug
     )
 
     sys.exit(0 if success else 1)